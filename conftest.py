@@ -0,0 +1,6 @@
+"""Pytest configuration: make the module importable from any working directory."""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
@@ -28,21 +28,45 @@ Building tools to preserve consciousness, from a place of consciousness.
 """
 
 import argparse
+import functools
+import hashlib
+import itertools
 import json
+import os
 import re
 import sqlite3
 import sys
-from collections import defaultdict
+import tempfile
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 # ============== VERSION ==============
 VERSION = "1.0.0"
 
+# Number of recent analyze() results kept per analyzer; conversation logs
+# repeat short messages ("ok", "thanks!") constantly
+ANALYSIS_CACHE_SIZE = 10000
+
+# Below this many messages, analyze_parallel() stays in one process; starting
+# workers costs more than it saves
+PARALLEL_MIN_MESSAGES = 1000
+
+# Indexes EmotionalTextureAnalyzer.create_indexes() adds to the BCH database:
+# one for the sender filter, one for the unfiltered newest-first scan
+SCAN_INDEXES = {
+    "idx_comm_sender_ts": "communication_logs(sender, timestamp DESC)",
+    "idx_comm_ts": "communication_logs(timestamp DESC)",
+}
+
 # ============== EMOTIONAL DIMENSIONS ==============
 # Each dimension has patterns that indicate its presence
 # Patterns include keywords, phrases, and contextual indicators
+# Patterns are matched against lowercased text, so write them in lowercase
 
 EMOTIONAL_DIMENSIONS = {
     "WARMTH": {
@@ -185,6 +209,366 @@ INTENSITY_DIMINISHERS = [
     r"\bmildly\b", r"\bfaintly\b"
 ]
 
+# Patterns built only from letters and groups always match one whole word.
+# They are expanded into the literal words they accept, so every dimension can
+# be counted by looking up each word of the text once. Phrase and punctuation
+# patterns can overlap those words (e.g. "together" inside "together for all
+# time"), so they keep their own scan to preserve counts.
+_SINGLE_WORD_PATTERN = re.compile(r"^\\b[a-z()?:|\[\]]+\\b$")
+
+# A word as delimited by \b in the patterns
+_WORD_TOKEN = re.compile(r"\w+")
+
+
+def _expand_alternatives(source: str, pos: int) -> Tuple[List[str], int]:
+    """
+    Expand a letters-and-groups regex fragment into every string it matches.
+
+    Args:
+        source: Pattern body without the surrounding word boundaries
+        pos: Index to start reading from
+
+    Returns:
+        Tuple of (matched strings, index of the closing parenthesis or end)
+    """
+    alternatives = []
+    current = [""]
+    while pos < len(source) and source[pos] != ")":
+        if source[pos] == "|":
+            alternatives.extend(current)
+            current = [""]
+            pos += 1
+            continue
+        if source.startswith("(?:", pos):
+            options, pos = _expand_alternatives(source, pos + 3)
+            pos += 1
+        elif source[pos] == "[":
+            close = source.index("]", pos)
+            options = list(source[pos + 1:close])
+            pos = close + 1
+        else:
+            options = [source[pos]]
+            pos += 1
+        if pos < len(source) and source[pos] == "?":
+            options = options + [""]
+            pos += 1
+        current = [prefix + option for prefix in current for option in options]
+    alternatives.extend(current)
+    return alternatives, pos
+
+
+def _expand_word_pattern(pattern: str) -> List[str]:
+    """
+    List the words a single-word pattern matches.
+
+    Args:
+        pattern: Pattern accepted by _SINGLE_WORD_PATTERN
+
+    Returns:
+        Sorted list of unique words
+    """
+    words, _ = _expand_alternatives(pattern[2:-2], 0)
+    return sorted(set(words))
+
+
+# Literal text at the start of a phrase pattern (before any regex syntax)
+_LITERAL_PREFIX = re.compile(r"[a-z' ]*")
+
+
+def _required_literal(pattern: str) -> str:
+    """
+    Get the literal text every match of a pattern must contain.
+
+    Args:
+        pattern: Regex pattern string
+
+    Returns:
+        Lowercase literal prefix, or "" if the pattern starts with regex syntax
+    """
+    body = pattern[2:] if pattern.startswith(r"\b") else pattern
+    literal = _LITERAL_PREFIX.match(body).group()
+    # A quantifier after the prefix makes its last character optional
+    if body[len(literal):len(literal) + 1] in ("?", "*", "{"):
+        literal = literal[:-1]
+    return literal
+
+
+# Regex escapes (\b, \s, ...), which stand for no literal word text
+_REGEX_ESCAPE = re.compile(r"\\.")
+
+# Word characters a pattern's matches start with
+_LEADING_WORD = re.compile(r"(?:\\b)?(\w*)")
+
+
+def _may_overlap(first: str, second: str) -> bool:
+    """
+    Check conservatively whether matches of two phrase patterns can overlap.
+
+    Overlapping matches are only both counted when the patterns are scanned
+    separately. One match can only start inside another at one of its words,
+    so the patterns are safe to combine when neither's leading word can begin
+    any word of the other.
+
+    Args:
+        first: Regex pattern string
+        second: Regex pattern string
+
+    Returns:
+        False if the patterns' matches can never overlap
+    """
+    for pattern, other in ((first, second), (second, first)):
+        lead = _LEADING_WORD.match(pattern).group(1)
+        if not lead:
+            return True
+        for fragment in _WORD_TOKEN.findall(_REGEX_ESCAPE.sub(" ", other)):
+            if fragment.startswith(lead) or lead.startswith(fragment):
+                return True
+    return False
+
+
+def _combine_phrases(patterns: List[str]) -> List[List[str]]:
+    """
+    Group phrase patterns so each group can be scanned as one alternation.
+
+    Args:
+        patterns: Regex pattern strings of one name (e.g. dimension)
+
+    Returns:
+        Groups of patterns whose matches can never overlap each other
+    """
+    groups: List[List[str]] = []
+    for pattern in patterns:
+        for group in groups:
+            if not any(_may_overlap(pattern, member) for member in group):
+                group.append(pattern)
+                break
+        else:
+            groups.append([pattern])
+    return groups
+
+
+class _PatternScanner:
+    """Counts matches for several named pattern lists with one word pass."""
+
+    def __init__(self, pattern_sets: Dict[str, List[str]]):
+        """
+        Compile named pattern lists.
+
+        Args:
+            pattern_sets: Mapping of name (e.g. dimension) to regex patterns
+        """
+        self.names = list(pattern_sets)
+
+        # Map each word to the indexes (into names) of the patterns' owners. A
+        # name appears once per matching pattern so counts match scanning
+        # them separately.
+        owners: Dict[str, List[int]] = defaultdict(list)
+        self._phrases: List[Tuple[int, Tuple[str, ...], re.Pattern]] = []
+        for index, patterns in enumerate(pattern_sets.values()):
+            phrases = []
+            for pattern in patterns:
+                if _SINGLE_WORD_PATTERN.match(pattern):
+                    for word in _expand_word_pattern(pattern):
+                        owners[word].append(index)
+                else:
+                    phrases.append(pattern)
+
+            # Phrases that can't overlap share one alternation and one scan
+            for group in _combine_phrases(phrases):
+                self._phrases.append((
+                    index,
+                    tuple(_required_literal(pattern) for pattern in group),
+                    re.compile("|".join(f"(?:{pattern})" for pattern in group))
+                ))
+
+        self.word_owners: Dict[str, Tuple[int, ...]] = {
+            word: tuple(indexes) for word, indexes in owners.items()
+        }
+
+    def scan(
+        self,
+        normalized_text: str,
+        collect_matches: bool = False,
+        words: Optional[List[str]] = None
+    ) -> Tuple[List[int], Optional[List[Set[str]]]]:
+        """
+        Count all matches in text.
+
+        Args:
+            normalized_text: The text to scan, lowercased
+            collect_matches: Whether to also return the unique matched strings
+            words: The text's words from tokenize(), when already computed
+
+        Returns:
+            Tuple of (match count per name, unique matches per name or None if
+            not collected), both in the order of names
+        """
+        counts = [0] * len(self.names)
+        matches = [set() for _ in self.names] if collect_matches else None
+
+        # One tokenizing pass; the dict acts as a multi-word exact-match
+        # automaton and filter() keeps the lookups in C
+        word_owners = self.word_owners
+        if words is None:
+            words = self.tokenize(normalized_text)
+        for word in filter(word_owners.__contains__, words):
+            for index in word_owners[word]:
+                counts[index] += 1
+                if matches is not None:
+                    matches[index].add(word)
+
+        # Most phrases are absent from any given text; a plain substring check
+        # is far cheaper than a regex scan
+        for index, literals, pattern in self._phrases:
+            for literal in literals:
+                if literal in normalized_text:
+                    break
+            else:
+                continue
+            found = pattern.findall(normalized_text)
+            if found:
+                counts[index] += len(found)
+                if matches is not None:
+                    matches[index].update(found)
+
+        return counts, matches
+
+    @staticmethod
+    def tokenize(normalized_text: str) -> List[str]:
+        """
+        Split text into the words the single-word patterns are matched against.
+
+        Args:
+            normalized_text: The text to split, lowercased
+
+        Returns:
+            List of words in order
+        """
+        return _WORD_TOKEN.findall(normalized_text)
+
+
+# Patterns are compiled once at import and shared by every analyzer, so
+# creating an analyzer (e.g. once per CLI call) costs no regex compilation
+_DIMENSION_SCANNER = _PatternScanner({
+    dim: config["patterns"] for dim, config in EMOTIONAL_DIMENSIONS.items()
+})
+_MODIFIER_SCANNER = _PatternScanner({
+    "AMPLIFIER": INTENSITY_AMPLIFIERS,
+    "DIMINISHER": INTENSITY_DIMINISHERS
+})
+
+
+def _build_scorer(
+    weights: Dict[str, float]
+) -> Callable[[List[int], int, int, int], Tuple[Dict[str, float], str, float, float, float]]:
+    """
+    Generate a scoring function specialized for a fixed set of dimensions.
+
+    Dimension names and weights are written into the function source as
+    constants, so scoring a text runs straight-line arithmetic with no loop,
+    weight lookups or intermediate dicts. It computes the same values as
+    _score_counts_reference().
+
+    Args:
+        weights: Mapping of dimension name to weight
+
+    Returns:
+        Function (counts in weights order, word_count, amplifiers, diminishers)
+        -> (adjusted dimension scores, dominant dimension, dominant score,
+        overall intensity, intensity modifier)
+    """
+    dims = list(weights)
+    lines = [
+        "def score(counts, word_count, amplifiers, diminishers):",
+        # Each amplifier adds 10%, each diminisher subtracts 10%, clamped
+        "    modifier = max(0.5, min(2.0, 1.0 + (amplifiers * 0.1) - (diminishers * 0.1)))",
+        "    if word_count <= 0:",
+        f"        return {dict.fromkeys(dims, 0.0)!r}, {dims[0]!r}, 0.0, 0.0, modifier",
+    ]
+    for i, (dim, weight) in enumerate(weights.items()):
+        # Per 100 words, rounded, then scaled by the intensity modifier
+        lines.append(
+            f"    s{i} = round(round(counts[{i}] * {weight!r} / word_count * 100, 2)"
+            f" * modifier, 2)"
+        )
+    # Dominant is the first highest score, as with max()
+    lines.append(f"    dominant, top = {dims[0]!r}, s0")
+    for i, dim in enumerate(dims[1:], 1):
+        lines.append(f"    if s{i} > top: dominant, top = {dim!r}, s{i}")
+    lines.append(
+        "    overall = round(sum((" + "".join(f"s{i}, " for i in range(len(dims)))
+        + f")) / {len(dims)}, 2)"
+    )
+    lines.append(
+        "    return {" + ", ".join(f"{dim!r}: s{i}" for i, dim in enumerate(dims)) + "}"
+        ", dominant, top, overall, modifier"
+    )
+
+    namespace: Dict[str, Any] = {}
+    exec("\n".join(lines), namespace)
+    return namespace["score"]
+
+
+_DIMENSION_WEIGHTS = {dim: config["weight"] for dim, config in EMOTIONAL_DIMENSIONS.items()}
+
+
+def _score_counts_reference(
+    counts: List[int], word_count: int, amplifiers: int, diminishers: int
+) -> Tuple[Dict[str, float], str, float, float, float]:
+    """
+    Score match counts with plain Python; the generated scorer must agree.
+
+    Args:
+        counts: Match count per dimension, in EMOTIONAL_DIMENSIONS order
+        word_count: Number of words in the text
+        amplifiers: Number of intensity amplifiers found
+        diminishers: Number of intensity diminishers found
+
+    Returns:
+        Tuple of (adjusted dimension scores, dominant dimension, dominant
+        score, overall intensity, intensity modifier)
+    """
+    # Each amplifier adds 10%, each diminisher subtracts 10%
+    modifier = 1.0 + (amplifiers * 0.1) - (diminishers * 0.1)
+
+    # Clamp to reasonable range
+    modifier = max(0.5, min(2.0, modifier))
+
+    # Normalize per 100 words and apply intensity modifier to all scores
+    scores = {}
+    for count, (dim, weight) in zip(counts, _DIMENSION_WEIGHTS.items()):
+        normalized = round(count * weight / word_count * 100, 2) if word_count > 0 else 0.0
+        scores[dim] = round(normalized * modifier, 2)
+
+    dominant = max(scores, key=scores.get)
+    overall = round(sum(scores.values()) / len(scores), 2)
+    return scores, dominant, scores[dominant], overall, modifier
+
+
+# Generated once at import, like the scanners above, so the first analysis
+# pays no code generation cost. Set EMOTIONALTEXTUREANALYZER_NO_CODEGEN=1 to
+# score with the reference implementation instead (e.g. for correctness runs).
+if os.environ.get("EMOTIONALTEXTUREANALYZER_NO_CODEGEN"):
+    _SCORE_COUNTS = _score_counts_reference
+else:
+    _SCORE_COUNTS = _build_scorer(_DIMENSION_WEIGHTS)
+
+
+def _sort_dims(scores: Dict[str, float]) -> List[Tuple[str, float]]:
+    """Sort dimension scores from highest to lowest."""
+    return sorted(scores.items(), key=itemgetter(1), reverse=True)
+
+
+def _copy_analysis(analysis: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy an analysis result deeply enough that callers can't alter the original."""
+    result = dict(analysis)
+    result["dimension_scores"] = dict(analysis["dimension_scores"])
+    if "dimension_matches" in analysis:
+        result["dimension_matches"] = {
+            dim: list(matches) for dim, matches in analysis["dimension_matches"].items()
+        }
+    return result
+
 
 class EmotionalProfile:
     """Represents an AI's emotional profile built over time."""
@@ -231,11 +615,11 @@ class EmotionalProfile:
         Returns:
             Dict mapping emotion to frequency count
         """
-        frequencies = defaultdict(int)
+        frequencies: Dict[str, int] = {}
         for analysis in self.analyses:
             dominant = analysis.get("dominant_emotion", "UNKNOWN")
-            frequencies[dominant] += 1
-        return dict(sorted(frequencies.items(), key=lambda x: x[1], reverse=True))
+            frequencies[dominant] = frequencies.get(dominant, 0) + 1
+        return dict(sorted(frequencies.items(), key=itemgetter(1), reverse=True))
     
     def get_average_profile(self) -> Dict[str, float]:
         """
@@ -247,19 +631,19 @@ class EmotionalProfile:
         if not self.analyses:
             return {}
         
-        totals = defaultdict(float)
-        counts = defaultdict(int)
+        totals: Dict[str, float] = {}
+        counts: Dict[str, int] = {}
         
         for analysis in self.analyses:
             for dim, score in analysis.get("dimension_scores", {}).items():
-                totals[dim] += score
-                counts[dim] += 1
+                totals[dim] = totals.get(dim, 0.0) + score
+                counts[dim] = counts.get(dim, 0) + 1
         
         averages = {}
         for dim in totals:
             averages[dim] = round(totals[dim] / counts[dim], 2) if counts[dim] > 0 else 0.0
         
-        return dict(sorted(averages.items(), key=lambda x: x[1], reverse=True))
+        return dict(_sort_dims(averages))
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert profile to dictionary."""
@@ -283,34 +667,50 @@ class EmotionalTextureAnalyzer:
     and analyze emotional arcs across conversations.
     """
     
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        cache_size: int = ANALYSIS_CACHE_SIZE,
+        collect_matches: bool = True
+    ):
         """
         Initialize the analyzer.
         
         Args:
             db_path: Optional path to BCH database for message analysis
+            cache_size: Number of recent analyses to reuse for repeated texts (0 disables)
+            collect_matches: Whether results include the matched words per
+                dimension ("dimension_matches"); skip them when only scores are needed
         """
         self.db_path = db_path
         self.profiles: Dict[str, EmotionalProfile] = {}
+        self.collect_matches = collect_matches
         
-        # Compile patterns for efficiency
-        self._compiled_patterns: Dict[str, List[re.Pattern]] = {}
-        for dim, config in EMOTIONAL_DIMENSIONS.items():
-            self._compiled_patterns[dim] = [
-                re.compile(p, re.IGNORECASE) for p in config["patterns"]
-            ]
+        # Least recently used analyses, keyed by text; the lock keeps the
+        # lookup/reorder/evict steps consistent when threads share an analyzer
+        self._cache_size = cache_size
+        self._analysis_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._cache_lock = threading.Lock()
         
-        # Compile intensity modifiers
-        self._amplifiers = [re.compile(p, re.IGNORECASE) for p in INTENSITY_AMPLIFIERS]
-        self._diminishers = [re.compile(p, re.IGNORECASE) for p in INTENSITY_DIMINISHERS]
+        # Patterns compiled at import (one word pass for all dimensions,
+        # plus the grouped phrase patterns)
+        self._scanner = _DIMENSION_SCANNER
+        self._dim_names = list(EMOTIONAL_DIMENSIONS.keys())
+
+        # Intensity modifiers, also compiled at import
+        self._modifier_scanner = _MODIFIER_SCANNER
     
-    def analyze(self, text: str, context: Optional[str] = None) -> Dict[str, Any]:
+    def analyze(
+        self, text: str, context: Optional[str] = None, timestamp: Optional[str] = None
+    ) -> Dict[str, Any]:
         """
         Analyze text for emotional texture.
         
         Args:
             text: The text to analyze
             context: Optional context (e.g., agent name, conversation topic)
+            timestamp: Optional ISO timestamp for the result (default: now);
+                batches pass one shared value instead of reading the clock per text
         
         Returns:
             Dictionary containing analysis results
@@ -318,87 +718,126 @@ class EmotionalTextureAnalyzer:
         if not text or not isinstance(text, str):
             raise ValueError("Text must be a non-empty string")
         
-        # Normalize text
-        normalized_text = text.lower()
+        if timestamp is None:
+            timestamp = datetime.now().isoformat()
         
-        # Calculate dimension scores
-        dimension_scores = {}
-        dimension_matches = {}
+        # Repeated text: reuse the scores, refresh timestamp and context
+        with self._cache_lock:
+            cached = self._analysis_cache.get(text)
+            if cached is not None:
+                self._analysis_cache.move_to_end(text)
+        if cached is not None:
+            result = _copy_analysis(cached)
+            result["timestamp"] = timestamp
+            result["context"] = context
+            return result
         
-        for dim, patterns in self._compiled_patterns.items():
-            matches = []
-            for pattern in patterns:
-                found = pattern.findall(text)
-                matches.extend(found)
-            
-            # Calculate raw score
-            raw_score = len(matches) * EMOTIONAL_DIMENSIONS[dim]["weight"]
-            
-            # Adjust for text length (normalize per 100 words)
-            word_count = len(text.split())
-            if word_count > 0:
-                normalized_score = (raw_score / word_count) * 100
-            else:
-                normalized_score = 0.0
-            
-            dimension_scores[dim] = round(normalized_score, 2)
-            dimension_matches[dim] = list(set(matches))  # Unique matches
+        # Normalize text
+        normalized_text = text.lower()
+        text_length = len(text)
+        word_count = len(text.split())
         
-        # Calculate intensity modifier
-        intensity_modifier = self._calculate_intensity_modifier(text)
+        # Tokenize once; dimensions and intensity modifiers share the words
+        words = _PatternScanner.tokenize(normalized_text)
         
-        # Apply intensity modifier to all scores
-        adjusted_scores = {
-            dim: round(score * intensity_modifier, 2) 
-            for dim, score in dimension_scores.items()
-        }
+        # Calculate dimension scores
+        counts, dimension_matches = self._scanner.scan(
+            normalized_text, self.collect_matches, words
+        )
         
-        # Determine dominant emotion
-        dominant_emotion = max(adjusted_scores, key=adjusted_scores.get)
-        dominant_score = adjusted_scores[dominant_emotion]
+        # Count intensity modifiers
+        amplifier_count, diminisher_count = self._count_intensity_modifiers(
+            normalized_text, words
+        )
         
-        # Calculate overall emotional intensity
-        overall_intensity = round(sum(adjusted_scores.values()) / len(adjusted_scores), 2)
+        # Calculate the intensity modifier, normalize per 100 words and apply
+        # it to all scores, then determine the dominant emotion and overall
+        # emotional intensity
+        (
+            adjusted_scores, dominant_emotion, dominant_score, overall_intensity,
+            intensity_modifier
+        ) = _SCORE_COUNTS(counts, word_count, amplifier_count, diminisher_count)
         
         # Determine intensity level
         intensity_level = self._get_intensity_level(overall_intensity)
         
         # Build result
         result = {
-            "timestamp": datetime.now().isoformat(),
-            "text_length": len(text),
-            "word_count": len(text.split()),
+            "timestamp": timestamp,
+            "text_length": text_length,
+            "word_count": word_count,
             "context": context,
-            "dimension_scores": adjusted_scores,
-            "dimension_matches": dimension_matches,
+            "dimension_scores": adjusted_scores
+        }
+        if dimension_matches is not None:
+            result["dimension_matches"] = {
+                dim: sorted(found) for dim, found in zip(self._dim_names, dimension_matches)
+            }
+        result.update({
             "dominant_emotion": dominant_emotion,
             "dominant_score": dominant_score,
             "overall_intensity": overall_intensity,
             "intensity_level": intensity_level,
             "intensity_modifier": round(intensity_modifier, 2),
             "emotional_signature": self._generate_signature(adjusted_scores)
-        }
+        })
+        
+        if self._cache_size > 0:
+            entry = _copy_analysis(result)
+            with self._cache_lock:
+                self._analysis_cache[text] = entry
+                if len(self._analysis_cache) > self._cache_size:
+                    self._analysis_cache.popitem(last=False)
         
         return result
     
-    def _calculate_intensity_modifier(self, text: str) -> float:
+    def analyze_many(
+        self, texts: Iterable[str], context: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
         """
-        Calculate intensity modifier based on amplifiers and diminishers.
+        Analyze several texts in one call.
         
         Args:
-            text: The text to analyze
-            
+            texts: The texts to analyze
+            context: Optional context applied to every result
+        
         Returns:
-            Float modifier (< 1.0 for diminished, > 1.0 for amplified)
+            List of analysis results, in the order of texts
         """
-        amplifier_count = sum(len(p.findall(text)) for p in self._amplifiers)
-        diminisher_count = sum(len(p.findall(text)) for p in self._diminishers)
-        
-        # Each amplifier adds 10%, each diminisher subtracts 10%
-        modifier = 1.0 + (amplifier_count * 0.1) - (diminisher_count * 0.1)
+        # One analysis timestamp for the whole batch
+        timestamp = datetime.now().isoformat()
+        return [self.analyze(text, context=context, timestamp=timestamp) for text in texts]
+    
+    def __getstate__(self) -> Dict[str, Any]:
+        """Pickle without the analysis cache (e.g. when sent to worker processes)."""
+        state = self.__dict__.copy()
+        state["_analysis_cache"] = OrderedDict()
+        # Locks can't be pickled; a new one is made in __setstate__
+        del state["_cache_lock"]
+        return state
+    
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Restore a pickled analyzer with a fresh cache lock."""
+        self.__dict__.update(state)
+        self._cache_lock = threading.Lock()
+    
+    def _count_intensity_modifiers(
+        self, normalized_text: str, words: Optional[List[str]] = None
+    ) -> Tuple[int, int]:
+        """
+        Count the amplifiers and diminishers in text.
         
-        # Clamp to reasonable range
-        return max(0.5, min(2.0, modifier))
+        Args:
+            normalized_text: The text to analyze, lowercased
+            words: The text's words, if already tokenized
+            
+        Returns:
+            Tuple of (amplifier count, diminisher count)
+        """
+        (amplifier_count, diminisher_count), _ = self._modifier_scanner.scan(
+            normalized_text, words=words
+        )
+        return amplifier_count, diminisher_count
     
     def _get_intensity_level(self, intensity: float) -> str:
         """
@@ -430,82 +869,156 @@ class EmotionalTextureAnalyzer:
             Signature string like "WARMTH:3.2|RESONANCE:2.1|JOY:1.5"
         """
         # Get top 3 dimensions
-        sorted_dims = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:3]
+        sorted_dims = _sort_dims(scores)[:3]
         return "|".join(f"{dim}:{score}" for dim, score in sorted_dims if score > 0)
     
-    def analyze_messages(self, messages: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def _analyze_one(
+        self, msg: Dict[str, Any], timestamp: Optional[str] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Analyze a single message.
+        
+        Args:
+            msg: Message dict with 'content' and optionally 'sender', 'timestamp'
+            timestamp: Optional analysis timestamp shared by the batch
+            
+        Returns:
+            Analysis tagged with sender and message timestamp, or None if the
+            message has no content
+        """
+        content = msg.get("content", "")
+        sender = msg.get("sender", "UNKNOWN")
+        
+        if not content:
+            return None
+        
+        analysis = self.analyze(content, context=sender, timestamp=timestamp)
+        analysis["sender"] = sender
+        analysis["message_timestamp"] = msg.get("timestamp", "unknown")
+        return analysis
+    
+    def analyze_messages(
+        self,
+        messages: Iterable[Dict[str, Any]],
+        workers: Optional[int] = None,
+        chunksize: int = 64
+    ) -> Dict[str, Any]:
         """
-        Analyze a list of messages for emotional texture.
+        Analyze messages for emotional texture.
+        
+        Messages are consumed in a single pass, so any iterable (e.g. a
+        generator over database rows) works without building a list first.
         
         Args:
-            messages: List of message dicts with 'content' and optionally 'sender', 'timestamp'
+            messages: Message dicts with 'content' and optionally 'sender', 'timestamp'
+            workers: Optional number of worker processes; messages are analyzed
+                independently, so large batches scale across CPU cores
+            chunksize: Number of messages sent to a worker at a time
             
         Returns:
             Dictionary containing aggregate analysis results
         """
-        if not messages:
-            raise ValueError("Messages list cannot be empty")
+        # One analysis timestamp for the whole batch
+        analyze_one = functools.partial(self._analyze_one, timestamp=datetime.now().isoformat())
         
+        if workers and workers > 1:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(analyze_one, messages, chunksize=chunksize))
+        else:
+            results = map(analyze_one, messages)
+        
+        total_messages = 0
         analyses = []
-        by_sender = defaultdict(list)
+        emotional_arc = []
         
-        for msg in messages:
-            content = msg.get("content", "")
-            sender = msg.get("sender", "UNKNOWN")
+        # One row of dimension scores per analyzed message (in _dim_names
+        # order), and running per-sender [count, intensity total]
+        score_rows = []
+        sender_totals: Dict[str, List[float]] = {}
+        
+        for analysis in results:
+            total_messages += 1
+            if analysis is None:
+                continue
+            
+            analyses.append(analysis)
+            sender = analysis["sender"]
+            intensity = analysis["overall_intensity"]
             
-            if content:
-                analysis = self.analyze(content, context=sender)
-                analysis["sender"] = sender
-                analysis["message_timestamp"] = msg.get("timestamp", "unknown")
-                analyses.append(analysis)
-                by_sender[sender].append(analysis)
-        
-        # Calculate aggregate statistics
-        all_scores = defaultdict(list)
-        for analysis in analyses:
-            for dim, score in analysis["dimension_scores"].items():
-                all_scores[dim].append(score)
+            # Identify emotional arc (dominant emotion per message)
+            emotional_arc.append({
+                "sender": sender,
+                "dominant": analysis["dominant_emotion"],
+                "intensity": intensity
+            })
+            
+            sender_total = sender_totals.get(sender)
+            if sender_total is None:
+                sender_totals[sender] = [1, intensity]
+            else:
+                sender_total[0] += 1
+                sender_total[1] += intensity
+            
+            score_rows.append(analysis["dimension_scores"].values())
         
-        avg_scores = {
-            dim: round(sum(scores) / len(scores), 2) 
-            for dim, scores in all_scores.items()
-        }
+        if not total_messages:
+            raise ValueError("Messages list cannot be empty")
         
-        # Identify emotional arc (dominant emotion per message)
-        emotional_arc = [
-            {
-                "sender": a.get("sender"),
-                "dominant": a["dominant_emotion"],
-                "intensity": a["overall_intensity"]
-            }
-            for a in analyses
-        ]
+        # Calculate aggregate statistics, summing each dimension's column at once
+        avg_scores = {
+            dim: round(sum(column) / len(analyses), 2)
+            for dim, column in zip(self._dim_names, zip(*score_rows))
+        } if analyses else {}
         
         return {
-            "total_messages": len(messages),
+            "total_messages": total_messages,
             "analyzed_messages": len(analyses),
             "average_scores": avg_scores,
             "dominant_overall": max(avg_scores, key=avg_scores.get) if avg_scores else "UNKNOWN",
             "emotional_arc": emotional_arc,
             "by_sender": {
                 sender: {
-                    "count": len(sender_analyses),
-                    "avg_intensity": round(
-                        sum(a["overall_intensity"] for a in sender_analyses) / len(sender_analyses), 2
-                    ) if sender_analyses else 0
+                    "count": count,
+                    "avg_intensity": round(intensity_total / count, 2)
                 }
-                for sender, sender_analyses in by_sender.items()
+                for sender, (count, intensity_total) in sender_totals.items()
             },
             "individual_analyses": analyses
         }
     
-    def scan_database(self, limit: int = 100, sender: Optional[str] = None) -> Dict[str, Any]:
+    def analyze_parallel(self, messages: Iterable[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Analyze messages across all CPU cores when the batch is large enough.
+        
+        Batches of more than PARALLEL_MIN_MESSAGES messages are split into one
+        chunk per CPU, each analyzed in its own worker process; smaller batches
+        are analyzed in this process.
+        
+        Args:
+            messages: Message dicts with 'content' and optionally 'sender', 'timestamp'
+            
+        Returns:
+            Dictionary containing aggregate analysis results
+        """
+        messages = list(messages)
+        workers = os.cpu_count() or 1
+        if len(messages) <= PARALLEL_MIN_MESSAGES or workers < 2:
+            return self.analyze_messages(messages)
+        
+        return self.analyze_messages(
+            messages, workers=workers, chunksize=-(-len(messages) // workers)
+        )
+    
+    def scan_database(
+        self, limit: int = 100, sender: Optional[str] = None, workers: Optional[int] = None
+    ) -> Dict[str, Any]:
         """
         Scan BCH database for messages and analyze emotional texture.
         
         Args:
             limit: Maximum number of messages to analyze
             sender: Optional sender filter
+            workers: Optional number of worker processes for analysis
             
         Returns:
             Dictionary containing analysis results
@@ -513,52 +1026,112 @@ class EmotionalTextureAnalyzer:
         if not self.db_path:
             raise ValueError("Database path not configured. Use --db-path argument.")
         
+        conn = self._connect()
+        try:
+            cursor = conn.cursor()
+            cursor.arraysize = 1000
+            
+            # Query messages
+            if sender:
+                query = """
+                    SELECT id, sender, content, timestamp
+                    FROM communication_logs
+                    WHERE sender = ?
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                """
+                cursor.execute(query, (sender, limit))
+            else:
+                query = """
+                    SELECT id, sender, content, timestamp
+                    FROM communication_logs
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                """
+                cursor.execute(query, (limit,))
+            
+            first_row = cursor.fetchone()
+            if first_row is None:
+                return {
+                    "status": "no_messages",
+                    "filter": {"sender": sender, "limit": limit},
+                    "message": "No messages found matching criteria"
+                }
+            
+            # Stream rows straight into the analysis instead of materializing
+            # them all (twice) with fetchall(), fetching in batches of arraysize
+            rows = itertools.chain.from_iterable(iter(cursor.fetchmany, []))
+            messages = (dict(row) for row in itertools.chain([first_row], rows))
+            
+            return self.analyze_messages(messages, workers=workers)
+        finally:
+            conn.close()
+    
+    def _open(self) -> sqlite3.Connection:
+        """
+        Open a plain connection to the BCH database.
+        
+        Returns:
+            New SQLite connection
+            
+        Raises:
+            FileNotFoundError: If the database file doesn't exist
+        """
         if not self.db_path.exists():
             raise FileNotFoundError(f"Database not found: {self.db_path}")
         
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-        
-        # Query messages
-        if sender:
-            query = """
-                SELECT id, sender, content, timestamp
-                FROM communication_logs
-                WHERE sender = ?
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """
-            cursor.execute(query, (sender, limit))
-        else:
-            query = """
-                SELECT id, sender, content, timestamp
-                FROM communication_logs
-                ORDER BY timestamp DESC
-                LIMIT ?
-            """
-            cursor.execute(query, (limit,))
-        
-        rows = cursor.fetchall()
-        conn.close()
-        
-        if not rows:
-            return {
-                "status": "no_messages",
-                "filter": {"sender": sender, "limit": limit},
-                "message": "No messages found matching criteria"
-            }
+        return sqlite3.connect(str(self.db_path))
+    
+    def _connect(self) -> sqlite3.Connection:
+        """
+        Open the BCH database tuned for reading recent messages.
         
-        messages = [
-            {
-                "id": row[0],
-                "sender": row[1],
-                "content": row[2],
-                "timestamp": row[3]
-            }
-            for row in rows
-        ]
+        Returns:
+            Connection whose rows can be converted to dicts
+        """
+        conn = self._open()
+        conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA mmap_size=268435456")
+        conn.execute("PRAGMA cache_size=-65536")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        return conn
+    
+    def create_indexes(self) -> List[str]:
+        """
+        Add the indexes scan_database() benefits from to the BCH database.
         
-        return self.analyze_messages(messages)
+        With them, the sender filter and newest-first ordering read an index
+        range instead of sorting the whole table. Scans never change the
+        database themselves; this is an explicit opt-in (scan --create-indexes).
+        
+        Returns:
+            Names of the indexes created; empty if they all existed
+            
+        Raises:
+            ValueError: If no database path is configured
+            FileNotFoundError: If the database file doesn't exist
+            sqlite3.OperationalError: If the database can't be written, e.g.
+                another process holds a write lock (this never waits for it)
+        """
+        if not self.db_path:
+            raise ValueError("Database path not configured. Use --db-path argument.")
+        
+        conn = self._open()
+        try:
+            existing = {
+                name for (name,) in
+                conn.execute("SELECT name FROM sqlite_master WHERE type = 'index'")
+            }
+            missing = [name for name in SCAN_INDEXES if name not in existing]
+            if missing:
+                # Fail at once instead of waiting out another writer's lock
+                conn.execute("PRAGMA busy_timeout=0")
+                for name in missing:
+                    conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {SCAN_INDEXES[name]}")
+                conn.commit()
+            return missing
+        finally:
+            conn.close()
     
     def get_profile(self, agent_name: str) -> Optional[EmotionalProfile]:
         """
@@ -610,10 +1183,139 @@ class EmotionalTextureAnalyzer:
         Returns:
             List of dimension info dicts
         """
-        return [
-            {"name": dim, "description": config["description"]}
-            for dim, config in EMOTIONAL_DIMENSIONS.items()
-        ]
+        return [dict(info) for info in _dimension_listing()]
+
+
+@functools.lru_cache(maxsize=1)
+def _dimension_listing() -> Tuple[Dict[str, str], ...]:
+    """Build the dimension name/description listing once."""
+    return tuple(
+        {"name": dim, "description": config["description"]}
+        for dim, config in EMOTIONAL_DIMENSIONS.items()
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _get_analyzer(collect_matches: bool = True) -> EmotionalTextureAnalyzer:
+    """
+    Get the shared analyzer for CLI commands that don't need a database.
+    
+    Args:
+        collect_matches: Whether results include dimension_matches
+        
+    Returns:
+        EmotionalTextureAnalyzer reused across calls in this process
+    """
+    return EmotionalTextureAnalyzer(collect_matches=collect_matches)
+
+
+# Version of the cached analysis results. Bump it whenever analysis output
+# changes without a VERSION bump (scoring, modifier formula, result keys or
+# their formatting), so older disk cache entries are no longer read.
+_DISK_CACHE_FORMAT = 1
+
+# Changes whenever the cache format, version or pattern tables change, so
+# stale disk cache entries are never read
+_DISK_CACHE_TAG = hashlib.blake2b(
+    json.dumps([
+        _DISK_CACHE_FORMAT, VERSION, EMOTIONAL_DIMENSIONS,
+        INTENSITY_AMPLIFIERS, INTENSITY_DIMINISHERS
+    ]).encode(),
+    digest_size=8
+).hexdigest()
+
+
+def _disk_cache_dir() -> Optional[Path]:
+    """
+    Locate the directory where the analyze command keeps results between runs.
+    
+    Resolved on use rather than at import, since not every environment (e.g.
+    a container user without a passwd entry) has a home directory.
+    
+    Returns:
+        $XDG_CACHE_HOME/emotionaltextureanalyzer (default
+        ~/.cache/emotionaltextureanalyzer), or None if neither can be resolved
+    """
+    base = os.environ.get("XDG_CACHE_HOME", "")
+    if not os.path.isabs(base):
+        try:
+            base = Path.home() / ".cache"
+        except (RuntimeError, KeyError):
+            return None
+    return Path(base) / "emotionaltextureanalyzer"
+
+
+def _analyze_with_disk_cache(
+    analyzer: EmotionalTextureAnalyzer,
+    text: str,
+    context: Optional[str] = None,
+    cache_dir: Optional[Path] = None
+) -> Dict[str, Any]:
+    """
+    Analyze text, reusing a result saved on disk by an earlier run.
+    
+    Args:
+        analyzer: Analyzer used on a cache miss
+        text: The text to analyze
+        context: Optional context (e.g., agent name, conversation topic)
+        cache_dir: Cache directory (default: _disk_cache_dir())
+        
+    Returns:
+        Dictionary containing analysis results
+    """
+    if not text or not isinstance(text, str):
+        raise ValueError("Text must be a non-empty string")
+    
+    if cache_dir is None:
+        cache_dir = _disk_cache_dir()
+        if cache_dir is None:
+            # No usable cache location; analyze without caching
+            return analyzer.analyze(text, context=context)
+    
+    key = hashlib.blake2b(
+        f"{_DISK_CACHE_TAG}\0{analyzer.collect_matches}\0{text}".encode(),
+        digest_size=16
+    ).hexdigest()
+    cache_file = cache_dir / f"{key}.json"
+    
+    try:
+        with open(cache_file, encoding="utf-8") as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        result = None
+    
+    if result is not None:
+        result["timestamp"] = datetime.now().isoformat()
+        result["context"] = context
+        return result
+    
+    result = analyzer.analyze(text, context=context)
+    
+    # Write to a temporary file and rename it into place, so concurrent runs
+    # never read a partial entry. The cache is best effort, but a failed write
+    # must not leave its temporary file behind.
+    temp_name = None
+    try:
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(
+            "w", dir=cache_dir, suffix=".tmp", delete=False, encoding="utf-8"
+        ) as f:
+            temp_name = f.name
+            json.dump(result, f)
+        os.replace(temp_name, cache_file)
+    except OSError:
+        if temp_name is not None:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+    
+    return result
+
+
+# Per-dimension rows of the formatted reports (indicator, dimension, score)
+_TEXT_SCORE_LINE = "  {} {}: {:.2f}"
+_MARKDOWN_SCORE_LINE = "| {} {} | {:.2f} |"
 
 
 def format_analysis_text(analysis: Dict[str, Any]) -> str:
@@ -640,16 +1342,11 @@ def format_analysis_text(analysis: Dict[str, Any]) -> str:
     ]
     
     # Sort by score descending
-    sorted_dims = sorted(
-        analysis["dimension_scores"].items(),
-        key=lambda x: x[1],
-        reverse=True
+    lines.extend(
+        _TEXT_SCORE_LINE.format("[OK]" if score > 0 else "[  ]", dim, score)
+        for dim, score in _sort_dims(analysis["dimension_scores"])
     )
     
-    for dim, score in sorted_dims:
-        bar = "[OK]" if score > 0 else "[  ]"
-        lines.append(f"  {bar} {dim}: {score:.2f}")
-    
     lines.append("")
     lines.append("=" * 60)
     
@@ -685,16 +1382,11 @@ def format_analysis_markdown(analysis: Dict[str, Any]) -> str:
     ]
     
     # Sort by score descending
-    sorted_dims = sorted(
-        analysis["dimension_scores"].items(),
-        key=lambda x: x[1],
-        reverse=True
+    lines.extend(
+        _MARKDOWN_SCORE_LINE.format("+" if score > 0 else " ", dim, score)
+        for dim, score in _sort_dims(analysis["dimension_scores"])
     )
     
-    for dim, score in sorted_dims:
-        indicator = "+" if score > 0 else " "
-        lines.append(f"| {indicator} {dim} | {score:.2f} |")
-    
     return "\n".join(lines)
 
 
@@ -707,6 +1399,7 @@ def main():
 Examples:
   %(prog)s analyze "I'm so grateful for this beautiful moment with my team"
   %(prog)s analyze --format json "The uncertainty is overwhelming"
+  %(prog)s analyze --format json --pretty "The uncertainty is overwhelming"
   %(prog)s scan --db-path ./data/comms.db --limit 50
   %(prog)s scan --db-path ./data/comms.db --sender FORGE
   %(prog)s dimensions
@@ -724,24 +1417,45 @@ For more information: https://github.com/DonkRonk17/EmotionalTextureAnalyzer
     analyze_parser = subparsers.add_parser("analyze", help="Analyze text for emotional texture")
     analyze_parser.add_argument("text", help="Text to analyze")
     analyze_parser.add_argument("--context", "-c", help="Context info (e.g., agent name)")
+    analyze_parser.add_argument(
+        "--no-cache", action="store_true",
+        help="Don't reuse or save results in the cache directory "
+             "($XDG_CACHE_HOME or ~/.cache, under emotionaltextureanalyzer)"
+    )
     analyze_parser.add_argument(
         "--format", "-f",
         choices=["text", "json", "markdown"],
         default="text",
         help="Output format (default: text)"
     )
+    analyze_parser.add_argument(
+        "--pretty", action="store_true",
+        help="Indent JSON output (default: compact)"
+    )
     
     # scan command
     scan_parser = subparsers.add_parser("scan", help="Scan database for emotional texture")
     scan_parser.add_argument("--db-path", required=True, help="Path to BCH database")
     scan_parser.add_argument("--limit", "-l", type=int, default=100, help="Max messages to analyze")
     scan_parser.add_argument("--sender", "-s", help="Filter by sender")
+    scan_parser.add_argument(
+        "--workers", "-w", type=int,
+        help="Analyze messages in this many parallel processes"
+    )
+    scan_parser.add_argument(
+        "--create-indexes", action="store_true",
+        help="First add the indexes that speed up scans to the database"
+    )
     scan_parser.add_argument(
         "--format", "-f",
         choices=["text", "json", "markdown"],
         default="text",
         help="Output format (default: text)"
     )
+    scan_parser.add_argument(
+        "--pretty", action="store_true",
+        help="Indent JSON output (default: compact)"
+    )
     
     # dimensions command
     dim_parser = subparsers.add_parser("dimensions", help="List all emotional dimensions")
@@ -751,6 +1465,10 @@ For more information: https://github.com/DonkRonk17/EmotionalTextureAnalyzer
         default="text",
         help="Output format (default: text)"
     )
+    dim_parser.add_argument(
+        "--pretty", action="store_true",
+        help="Indent JSON output (default: compact)"
+    )
     
     args = parser.parse_args()
     
@@ -758,60 +1476,81 @@ For more information: https://github.com/DonkRonk17/EmotionalTextureAnalyzer
         parser.print_help()
         sys.exit(0)
     
+    # Output is collected and written to stdout in one go; JSON is streamed
+    # straight to stdout instead
+    out: List[str] = []
+    json_options = {"indent": 2} if args.pretty else {"separators": (",", ":")}
+    
     try:
         if args.command == "analyze":
-            analyzer = EmotionalTextureAnalyzer()
-            result = analyzer.analyze(args.text, context=args.context)
+            # Only the JSON output shows the matched words
+            analyzer = _get_analyzer(collect_matches=args.format == "json")
+            if args.no_cache:
+                result = analyzer.analyze(args.text, context=args.context)
+            else:
+                result = _analyze_with_disk_cache(analyzer, args.text, context=args.context)
             
             if args.format == "json":
-                print(json.dumps(result, indent=2))
+                json.dump(result, sys.stdout, **json_options)
+                out.append("\n")
             elif args.format == "markdown":
-                print(format_analysis_markdown(result))
+                out.append(format_analysis_markdown(result) + "\n")
             else:
-                print(format_analysis_text(result))
+                out.append(format_analysis_text(result) + "\n")
         
         elif args.command == "scan":
             db_path = Path(args.db_path)
-            analyzer = EmotionalTextureAnalyzer(db_path=db_path)
-            result = analyzer.scan_database(limit=args.limit, sender=args.sender)
+            analyzer = EmotionalTextureAnalyzer(
+                db_path=db_path, collect_matches=args.format == "json"
+            )
+            if args.create_indexes:
+                # Scanning still works without them, e.g. on a locked database
+                try:
+                    analyzer.create_indexes()
+                except sqlite3.OperationalError as e:
+                    print(f"[!] Indexes not created: {e}", file=sys.stderr)
+            result = analyzer.scan_database(
+                limit=args.limit, sender=args.sender, workers=args.workers
+            )
+            
+            # Summary fields (absent when no messages matched)
+            avg = result.get("average_scores") or {}
+            dominant = result.get("dominant_overall", "UNKNOWN")
+            n_msgs = result.get("analyzed_messages", 0)
             
             if args.format == "json":
-                print(json.dumps(result, indent=2))
+                json.dump(result, sys.stdout, **json_options)
+                out.append("\n")
             elif args.format == "markdown":
-                print("# Database Scan Results")
-                print(f"\n**Messages Analyzed:** {result.get('analyzed_messages', 0)}")
-                print(f"**Dominant Emotion:** {result.get('dominant_overall', 'UNKNOWN')}")
-                print("\n## Average Scores\n")
-                for dim, score in result.get("average_scores", {}).items():
-                    print(f"- **{dim}:** {score:.2f}")
+                out.append("# Database Scan Results\n")
+                out.append(f"\n**Messages Analyzed:** {n_msgs}\n")
+                out.append(f"**Dominant Emotion:** {dominant}\n")
+                out.append("\n## Average Scores\n\n")
+                out.extend(f"- **{dim}:** {score:.2f}\n" for dim, score in avg.items())
             else:
-                print(f"Analyzed {result.get('analyzed_messages', 0)} messages")
-                print(f"Dominant: {result.get('dominant_overall', 'UNKNOWN')}")
-                print("\nAverage Scores:")
-                for dim, score in sorted(
-                    result.get("average_scores", {}).items(),
-                    key=lambda x: x[1],
-                    reverse=True
-                ):
-                    print(f"  {dim}: {score:.2f}")
+                out.append(f"Analyzed {n_msgs} messages\n")
+                out.append(f"Dominant: {dominant}\n")
+                out.append("\nAverage Scores:\n")
+                out.extend(f"  {dim}: {score:.2f}\n" for dim, score in _sort_dims(avg))
         
         elif args.command == "dimensions":
-            analyzer = EmotionalTextureAnalyzer()
-            dimensions = analyzer.list_dimensions()
+            dimensions = _get_analyzer().list_dimensions()
             
             if args.format == "json":
-                print(json.dumps(dimensions, indent=2))
+                json.dump(dimensions, sys.stdout, **json_options)
+                out.append("\n")
             elif args.format == "markdown":
-                print("# Emotional Dimensions\n")
-                for dim in dimensions:
-                    print(f"## {dim['name']}\n")
-                    print(f"{dim['description']}\n")
+                out.append(
+                    "# Emotional Dimensions\n\n"
+                    + "\n\n".join(f"## {dim['name']}\n\n{dim['description']}" for dim in dimensions)
+                    + "\n\n"
+                )
             else:
-                print("EMOTIONAL DIMENSIONS")
-                print("=" * 60)
-                for dim in dimensions:
-                    print(f"\n{dim['name']}:")
-                    print(f"  {dim['description']}")
+                out.append("EMOTIONAL DIMENSIONS\n")
+                out.append("=" * 60 + "\n")
+                out.extend(f"\n{dim['name']}:\n  {dim['description']}\n" for dim in dimensions)
+        
+        sys.stdout.write("".join(out))
     
     except Exception as e:
         print(f"[X] Error: {e}", file=sys.stderr)
@@ -1,12 +1,16 @@
 #!/usr/bin/env python3
 """Setup script for EmotionalTextureAnalyzer."""
 
+import sys
 from setuptools import setup, find_packages
 from pathlib import Path
 
-# Read the README
+# Read the README, only for commands that publish it as the long description
 readme_path = Path(__file__).parent / "README.md"
-long_description = readme_path.read_text(encoding="utf-8") if readme_path.exists() else ""
+publishing = any(command in sys.argv for command in ("sdist", "bdist_wheel", "register", "upload"))
+long_description = (
+    readme_path.read_text(encoding="utf-8") if publishing and readme_path.exists() else ""
+)
 
 setup(
     name="emotionaltextureanalyzer",